@@ -5,7 +5,7 @@ from fastapi import Depends, APIRouter
 from passlib.context import CryptContext
 from starlette import status
 from fastapi_todo_app import database, models
-from sqlmodel import Session, select, SQLModel, Field
+from sqlmodel import select, SQLModel, Field
 from datetime import timedelta, datetime, timezone
 from jose import JWTError, jwt
 import os
@@ -45,16 +45,9 @@ class Token(SQLModel):
     access_token: str = Field(nullable=False)
     token_type: str = Field(nullable=False)
 
-# Dependency function to get the database session
-
-
-def get_db():
-    with Session(database.engine) as session:
-        yield session
-
-
-# Annotated dependency for injecting the database session
-db_dependency = Annotated[Session, Depends(get_db)]
+# Shared database session dependency
+get_db = database.get_db
+db_dependency = database.db_dependency
 
 # Route for user signup with status code for successful creation
 
@@ -1,8 +1,9 @@
 # database.py
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine
 from fastapi_todo_app import settings
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from contextlib import asynccontextmanager
+from typing import Annotated
 
 # only needed for psycopg 3 - replace postgresql
 # with postgresql+psycopg in settings.DATABASE_URL
@@ -17,6 +18,19 @@ engine = create_engine(
     connection_string, connect_args={"sslmode": "require"}, pool_recycle=300
 )
 
+# Shared dependency function to get the database session.
+# A Session only checks a connection out of the pool when the first
+# statement runs, so requests rejected by get_current_user or routes
+# that never query leave the pool untouched.
+def get_db():
+    with Session(engine) as session:
+        yield session
+
+
+# Annotated dependency for injecting the database session
+db_dependency = Annotated[Session, Depends(get_db)]
+
+
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 # The first part of the function, before the yield, will
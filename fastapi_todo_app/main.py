@@ -1,8 +1,8 @@
 # main.py
-from sqlmodel import Session, select
-from fastapi import FastAPI, HTTPException, Depends
+from sqlmodel import select
+from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi_todo_app import auth, models, database
-from typing import Annotated
+from typing import Annotated, Optional
 
 # Aliases to simplify imports and improve code readability
 Todo = models.Todo  # Alias for the Todo model
@@ -22,13 +22,11 @@ app = FastAPI(lifespan=lifespan, title="FastAPI Todo App",
 # Include the authentication router to handle auth-related routes
 app.include_router(auth.router)
 
-# Dependency function to get the database session
-def get_db():
-    with Session(database.engine) as session:
-        yield session
+# Shared database session dependency, also used by the auth router
+get_db = database.get_db
 
 # Annotated dependencies for type hinting and dependency injection
-db_dependency = Annotated[Session, Depends(get_db)]  # Database session dependency
+db_dependency = database.db_dependency  # Database session dependency
 user_dependency = Annotated[dict, Depends(get_current_user)]  # Current user dependency
 
 # Root endpoint to welcome users to the Todo app
@@ -38,7 +36,7 @@ def read_root():
 
 # Endpoint to create a new todo item
 @app.post("/todos/", response_model=Todo, tags=["todos"])
-def create_todo(todo: Todo, db: db_dependency, user: user_dependency):
+def create_todo(todo: Todo, user: user_dependency, db: db_dependency):
     # Check if the user is authenticated
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
@@ -55,15 +53,26 @@ def create_todo(todo: Todo, db: db_dependency, user: user_dependency):
     
     return new_todo
 
-# Endpoint to read all todo items for the current user
+# Endpoint to read the todo items for the current user.
+# completed filters by status. When offset or limit is given the todos are
+# paged newest first (id descending); otherwise all matching todos are
+# returned in the database's default order, as before.
 @app.get("/todos/", response_model=list[Todo], tags=["todos"])
-def read_todos(db: db_dependency, user: user_dependency):
+def read_todos(user: user_dependency, db: db_dependency,
+               offset: Annotated[int, Query(ge=0)] = 0,
+               limit: Annotated[Optional[int], Query(ge=1, le=100)] = None,
+               completed: Optional[bool] = None):
     # Check if the user is authenticated
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    # Retrieve all todos for the current user from the database
-    todos = db.exec(select(Todo).where(Todo.user_id == user["id"])).all()
+    # Retrieve the requested page of todos for the current user from the database
+    statement = select(Todo).where(Todo.user_id == user["id"])
+    if completed is not None:
+        statement = statement.where(Todo.completed == completed)
+    if offset or limit is not None:
+        statement = statement.order_by(Todo.id.desc()).offset(offset).limit(limit)
+    todos = db.exec(statement).all()
 
     # Check if any todos were found
     if not todos:
@@ -73,7 +82,7 @@ def read_todos(db: db_dependency, user: user_dependency):
 
 # Endpoint to read a specific todo item by ID
 @app.get("/todos/{id}", response_model=Todo, tags=["todos"])
-def read_todo(id: int, db: db_dependency, user: user_dependency):
+def read_todo(id: int, user: user_dependency, db: db_dependency):
     # Check if the user is authenticated
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
@@ -91,7 +100,7 @@ def read_todo(id: int, db: db_dependency, user: user_dependency):
 
 # Endpoint to update a specific todo item by ID
 @app.put("/todos/{id}", response_model=Todo, tags=["todos"])
-def update_todo(id: int, todo: Todo, db: db_dependency, user: user_dependency):
+def update_todo(id: int, todo: Todo, user: user_dependency, db: db_dependency):
     # Check if the user is authenticated
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
@@ -114,7 +123,7 @@ def update_todo(id: int, todo: Todo, db: db_dependency, user: user_dependency):
 
 # Endpoint to delete a specific todo item by ID
 @app.delete("/todos/{id}", response_model=Todo, tags=["todos"])
-def delete_todo(id: int, db: db_dependency, user: user_dependency):
+def delete_todo(id: int, user: user_dependency, db: db_dependency):
     # Check if the user is authenticated
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
@@ -1,22 +1,46 @@
 import streamlit as st
 import requests
-from requests import post
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta, timezone
 from streamlit_modal import Modal
 
 
 API_BASE_URL = "https://infinitely-engaged-ladybug.ngrok-free.app"
 
+# The API sends no ETags, so cached tasks are refetched after this many
+# seconds to pick up todos created by other clients
+TASKS_CACHE_TTL = 30
+
+
+def get_http_session():
+    # One keep-alive session per user session, so API calls reuse the
+    # TCP/TLS connection instead of handshaking on every request
+    if 'http_session' not in st.session_state:
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3,
+                        status_forcelist=[502, 503, 504])
+        session.mount("https://", HTTPAdapter(max_retries=retries))
+        session.mount("http://", HTTPAdapter(max_retries=retries))
+        st.session_state.http_session = session
+    return st.session_state.http_session
+
+
+def invalidate_tasks():
+    # Drop the cached task pages so the next get_tasks() refetches them
+    st.session_state.pop('tasks_cache', None)
+
 
 def logout_user():
     # Clear the session state of the token and expiration
     st.session_state.token = None
     st.session_state.token_expiration = None
+    invalidate_tasks()
     st.rerun()
 
 
 def login_user(username, password):
-    response = post(
+    response = get_http_session().post(
         f"{API_BASE_URL}/auth/token",
         data={"username": username, "password": password}
     )
@@ -26,7 +50,7 @@ def login_user(username, password):
 
 
 def register_user(username, email, password):
-    response = requests.post(
+    response = get_http_session().post(
         f"{API_BASE_URL}/auth/signup",
         json={"username": username, "email": email, "password": password}
     )
@@ -43,6 +67,7 @@ def login_and_registration():
             token_info = login_user(username, password)
             if token_info:
                 st.session_state.token = token_info['access_token']
+                invalidate_tasks()
                 st.session_state.token_expiration = datetime.now(
                     timezone.utc) + timedelta(minutes=20)
                 st.rerun()
@@ -65,7 +90,7 @@ if st.session_state.get('token') is None or datetime.now(timezone.utc) >= st.ses
     login_and_registration()
 else:
     def refresh_token():
-        response = requests.post(f"{API_BASE_URL}/auth/refresh_token", headers={
+        response = get_http_session().post(f"{API_BASE_URL}/auth/refresh_token", headers={
             "Authorization": f"Bearer {st.session_state.token}"
         })
 
@@ -81,25 +106,52 @@ else:
 
     check_and_refresh_token()
 
-    def get_tasks():
+    def get_tasks(completed=None, page_size=20, page=0):
+        # Serve reruns from the cached page; add/update/delete invalidate
+        # the cache, so only the visible page is fetched again. Returns
+        # (tasks, has_more), or None when the API could not be reached.
+        key = (st.session_state.token, completed, page_size, page)
+        now = datetime.now(timezone.utc)
+        cache = st.session_state.setdefault('tasks_cache', {})
+        entry = cache.get(key)
+        if entry is not None and now - entry['fetched_at'] <= timedelta(seconds=TASKS_CACHE_TTL):
+            return entry['tasks'], entry['has_more']
+
         headers = {
             "Authorization": f"Bearer {st.session_state.token}"
         }
-        response = requests.get(f"{API_BASE_URL}/todos/", headers=headers)
+        # Ask for one extra todo to know whether another page exists
+        params = {"offset": page * page_size, "limit": page_size + 1}
+        if completed is not None:
+            params["completed"] = completed
+        try:
+            response = get_http_session().get(
+                f"{API_BASE_URL}/todos/", params=params, headers=headers)
+        except requests.RequestException:
+            st.error('Failed to load tasks.')
+            return None
         if response.status_code == 404:
-            return []
-        tasks = response.json()
-        return tasks
+            tasks = []
+        elif response.ok:
+            tasks = response.json()
+        else:
+            # Never cache error responses; the next rerun retries
+            st.error('Failed to load tasks.')
+            return None
+        cache[key] = {'tasks': tasks[:page_size],
+                      'has_more': len(tasks) > page_size, 'fetched_at': now}
+        return cache[key]['tasks'], cache[key]['has_more']
 
     def add_task(content, completed=False):
         headers = {
             "Authorization": f"Bearer {st.session_state.token}"
         }
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/todos/",
             json={"content": content, "completed": completed},
             headers=headers
         )
+        invalidate_tasks()
         return response.json()
 
     # Function to delete a task
@@ -108,8 +160,9 @@ else:
         headers = {
             "Authorization": f"Bearer {st.session_state.token}"
         }
-        response = requests.delete(
+        response = get_http_session().delete(
             f"{API_BASE_URL}/todos/{task_id}", headers=headers)
+        invalidate_tasks()
         return response.json()
 
     # Function to update a task
@@ -118,23 +171,30 @@ else:
         headers = {
             "Authorization": f"Bearer {st.session_state.token}"
         }
-        response = requests.put(
+        response = get_http_session().put(
             f"{API_BASE_URL}/todos/{task_id}",
             json={"content": new_content, "completed": new_completed},
             headers=headers
         )
+        invalidate_tasks()
         return response.json()
 
     if 'edit_task_id' not in st.session_state:
         st.session_state.edit_task_id = None
 
+    if 'task_page' not in st.session_state:
+        st.session_state.task_page = 0
+
     # Function to display tasks with edit buttons
 
 edit_modal = Modal(key="edit-modal", title="Edit Task")
 
+# Task list filters mapped to the API's completed query parameter
+TASK_FILTERS = {"All": None, "Pending": False, "Completed": True}
+
 
 def display_tasks(tasks):
-    for task in reversed(tasks):
+    for task in tasks:
         with st.container(border=True):
             st.write(task['content'])
             if task['completed']:
@@ -156,6 +216,25 @@ def display_tasks(tasks):
                     st.rerun()
 
 
+def reset_task_page():
+    # Start again from the first page when the filter or page size changes
+    st.session_state.task_page = 0
+
+
+def display_page_navigation(has_more):
+    previous_button, page_label, next_button = st.columns([1, 2, 1])
+    with previous_button:
+        if st.button('Previous', disabled=st.session_state.task_page == 0):
+            st.session_state.task_page -= 1
+            st.rerun()
+    with page_label:
+        st.write(f"Page {st.session_state.task_page + 1}")
+    with next_button:
+        if st.button('Next', disabled=not has_more):
+            st.session_state.task_page += 1
+            st.rerun()
+
+
 def display_edit_form():
     if edit_modal.is_open():
         with edit_modal.container():
@@ -183,8 +262,13 @@ def display_edit_form():
 def main():
     if st.session_state.get('token'):
         st.title('FastAPI todo App')
-        if st.button('Logout'):
-            logout_user()
+        logout_column, refresh_column = st.columns(2)
+        with logout_column:
+            if st.button('Logout'):
+                logout_user()
+        with refresh_column:
+            if st.button('Refresh'):
+                invalidate_tasks()
 
         # Input for new task content
         with st.container(border=True):
@@ -200,10 +284,28 @@ def main():
                     st.error('Failed to add task.')
                 st.rerun()
 
-        # Display tasks and edit form based on session state
-        tasks = get_tasks()
+        # Filter and page size for the task list
+        filter_column, page_size_column = st.columns(2)
+        with filter_column:
+            task_filter = st.radio('Show', list(TASK_FILTERS), horizontal=True,
+                                   key='task_filter', on_change=reset_task_page)
+        with page_size_column:
+            page_size = st.selectbox('Tasks per page', [10, 20, 50], index=1,
+                                     key='task_page_size', on_change=reset_task_page)
+
+        # Display the current page of tasks and the edit form
+        result = get_tasks(TASK_FILTERS[task_filter], page_size,
+                           st.session_state.task_page)
+        if result is None:
+            return
+        tasks, has_more = result
+        if not tasks and st.session_state.task_page > 0:
+            # The page emptied out (e.g. its last task was deleted)
+            st.session_state.task_page -= 1
+            st.rerun()
         if tasks:
             display_tasks(tasks)
+            display_page_navigation(has_more)
             # if st.session_state.edit_task_id is not None:
             display_edit_form()
         else:
@@ -56,6 +56,36 @@ def test_read_main():
     assert response.json() == {"message": "Welcome to MK's Todo App API"}
 
 
+# Test that rejected requests never open a database session
+@pytest.mark.parametrize("method, url", [
+    ("post", "/todos/"),
+    ("get", "/todos/"),
+    ("get", "/todos/1"),
+    ("put", "/todos/1"),
+    ("delete", "/todos/1"),
+])
+@pytest.mark.parametrize("headers", [
+    {},
+    {"Authorization": "Bearer invalid-token"},
+])
+def test_unauthenticated_request_skips_db(method, url, headers, monkeypatch):
+    sessions_opened = []
+
+    def get_session_spy():
+        sessions_opened.append(True)
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, get_session_spy)
+    response = client.request(
+        method, url,
+        json={"content": "Test Todo", "completed": False},
+        headers=headers
+    )
+    assert response.status_code == 401
+    assert sessions_opened == []
+
+
 # Test creating a new todo item
 def test_create_todo(create_user_and_get_token):
     token = create_user_and_get_token
@@ -80,6 +110,56 @@ def test_read_todos(create_user_and_get_token):
     assert isinstance(response.json(), list)
 
 
+# Test reading a filtered page of todo items
+
+
+def test_read_todos_paginated(create_user_and_get_token):
+    token = create_user_and_get_token
+    headers = {"Authorization": f"Bearer {token}"}
+    create_response = client.post(
+        "/todos/",
+        json={"content": "Second Test Todo", "completed": False},
+        headers=headers
+    )
+    assert create_response.status_code == 200
+    newest_todo = create_response.json()
+
+    # Pages come newest first
+    response = client.get("/todos/", params={"limit": 2}, headers=headers)
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page) == 2
+    assert first_page[0]["id"] == newest_todo["id"]
+    assert first_page[0]["id"] > first_page[1]["id"]
+
+    # offset skips the first todo
+    response = client.get(
+        "/todos/", params={"offset": 1, "limit": 1}, headers=headers)
+    assert response.status_code == 200
+    assert [todo["id"] for todo in response.json()] == [first_page[1]["id"]]
+
+    # completed filters by status
+    response = client.get(
+        "/todos/", params={"limit": 1, "completed": False}, headers=headers)
+    assert response.status_code == 200
+    todos = response.json()
+    assert len(todos) == 1
+    assert todos[0]["completed"] is False
+
+    # An offset past the end returns 404
+    response = client.get(
+        "/todos/", params={"offset": 10000, "limit": 10}, headers=headers)
+    assert response.status_code == 404
+
+    # limit is capped at 100
+    response = client.get("/todos/", params={"limit": 101}, headers=headers)
+    assert response.status_code == 422
+
+    delete_response = client.delete(
+        f"/todos/{newest_todo['id']}", headers=headers)
+    assert delete_response.status_code == 200
+
+
 def test_update_todo(create_user_and_get_token):
     token = create_user_and_get_token
     get_response = client.get(